@@ -8,13 +8,17 @@ New in this version
 - Melody→TAB: convert ABC melody into single‑note guitar tab (standard tuning), with 3 bars per printed line.
 - Chord mapping UX: while mapping notes→chords, you can add a brand‑new chord and it will be added to the global library if not present.
 - Back everywhere: every submenu offers a `0) Back` option.
+- Inbox watching: with the optional `watchdog` package installed, files dropped into abc_inbox/ are imported in the background.
 
 Folder layout
 -------------
 project_root/
-  data/chords.json
+  data/chords.db        # chord library (SQLite; not tracked)
+  data/chords.json      # portable copy: seeds a new chords.db, written by "Export chord library"
   abc_inbox/            # drop .txt ABC files here
-  abc_processed/        # processed ABC files moved here
+  abc_processed/        # processed ABC files moved here; on the same filesystem each is a
+                        # hard link to its song's abc.txt, so editing abc.txt in place
+                        # (rather than save-to-temp-and-rename) changes the archived copy too
   songs/
     <SongName>/
       abc.txt           # raw ABC (body preserved)
@@ -24,12 +28,17 @@ project_root/
 
 """
 from __future__ import annotations
-import json
+import os
 import re
-import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 # =============== Paths & Setup ===============
 ROOT = Path(__file__).resolve().parent
@@ -37,7 +46,10 @@ DATA_DIR = ROOT / "data"
 SONGS_DIR = ROOT / "songs"
 INBOX_DIR = ROOT / "abc_inbox"
 PROCESSED_DIR = ROOT / "abc_processed"
-CHORDS_DB = DATA_DIR / "chords.json"
+CHORDS_DB = DATA_DIR / "chords.db"
+CHORDS_JSON = DATA_DIR / "chords.json"
+
+StrPath = Union[str, Path]
 
 for p in [DATA_DIR, SONGS_DIR, INBOX_DIR, PROCESSED_DIR]:
     p.mkdir(parents=True, exist_ok=True)
@@ -53,6 +65,57 @@ def input_nonempty(prompt: str, allow_back: bool = True) -> Optional[str]:
             return s
         print("Please enter something (or 0 to go back).")
 
+@lru_cache(maxsize=None)
+def load_orjson():
+    # Optional native JSON encoder/decoder, imported on first use: it loads the stdlib
+    # json module as well, and a session can start without touching any JSON.
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+def json_loads(data: bytes):
+    orjson = load_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json  # deferred: only needed without orjson
+    return json.loads(data)
+
+def json_dumps(obj, indent: bool = True) -> bytes:
+    orjson = load_orjson()
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib, which stringifies non-str keys instead of raising.
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    import json  # deferred: only needed without orjson
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_lines(path: StrPath, lines: Iterable[str]) -> None:
+    # Streams newline-separated lines (no trailing newline) without joining them first.
+    with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        first = True
+        for line in lines:
+            if not first:
+                f.write('\n')
+            f.write(line)
+            first = False
+
+def read_bytes(path: StrPath) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+def write_bytes_atomic(path: StrPath, data: bytes) -> None:
+    # Write beside the target and swap it in, so an interrupted save never truncates it.
+    tmp = os.fspath(path) + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 def yn(prompt: str) -> bool:
     while True:
         s = input(f"{prompt} [y/n]: ").strip().lower()
@@ -62,12 +125,47 @@ def yn(prompt: str) -> bool:
 
 # =============== Chord Library ===============
 
+SHAPE_STRIP = str.maketrans('', '', '- ')
+SHAPE_SEP_RE = re.compile(r"[,/|]\s*")
+
+# Shapes repeat across every token of a song; cache the split per distinct string.
+@lru_cache(maxsize=512)
+def split_shape_cached(shape: str) -> Tuple[str, ...]:
+    s = shape.translate(SHAPE_STRIP)
+    if len(s) == 6:
+        s = s.lower()
+        if not s.strip("0123456789x"):
+            return tuple(s)
+    if any(sep in shape for sep in [',', '/', '|']):
+        parts = SHAPE_SEP_RE.split(shape)
+        return tuple(p.strip().lower() for p in parts if p.strip())
+    if ' ' in shape:
+        return tuple(p.strip().lower() for p in shape.split(' ') if p.strip())
+    # Single pass equivalent of re.findall(r"x|\d+", shape.lower())
+    groups: List[str] = []
+    run = ''
+    for c in shape.lower():
+        if c.isdecimal():
+            run += c
+            continue
+        if run:
+            groups.append(run)
+            run = ''
+        if c == 'x':
+            groups.append('x')
+    if run:
+        groups.append(run)
+    return tuple(groups)
+
 @dataclass
 class ChordShape:
     name: str      # e.g., "E", "Am", "Gadd9"
     shape: str     # six entries low→high EADGBe; examples: "022100", "320003", "x02210"
 
     def validate(self) -> None:
+        s = self.shape.translate(SHAPE_STRIP)
+        if len(s) == 6 and not s.lower().strip("0123456789x"):
+            return  # the common "x02210" form: six valid single-character strings
         groups = self._split_shape(self.shape)
         if len(groups) != 6:
             raise ValueError("Chord shape must describe exactly 6 strings (E A D G B e). Use digits or 'x'.")
@@ -77,39 +175,110 @@ class ChordShape:
 
     @staticmethod
     def _split_shape(shape: str) -> List[str]:
-        s = shape.replace('-', '').replace(' ', '')
-        if len(s) == 6 and re.fullmatch(r"[0-9xX]{6}", s):
-            return list(s.lower())
-        if any(sep in shape for sep in [',', '/', '|']):
-            parts = re.split(r"[,/|]\s*", shape)
-            return [p.strip().lower() for p in parts if p.strip()]
-        if ' ' in shape:
-            return [p.strip().lower() for p in shape.split(' ') if p.strip()]
-        return re.findall(r"x|\d+", shape.lower())
+        return list(split_shape_cached(shape))
+
+CHORDS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chords (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    shape TEXT NOT NULL
+);
+"""
+# Trigram FTS5 index (SQLite 3.34+) so find() is an indexed substring search.
+CHORDS_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS chords_fts USING fts5(
+    name, shape, content='chords', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS chords_ai AFTER INSERT ON chords BEGIN
+    INSERT INTO chords_fts(rowid, name, shape) VALUES (new.id, new.name, new.shape);
+END;
+CREATE TRIGGER IF NOT EXISTS chords_ad AFTER DELETE ON chords BEGIN
+    INSERT INTO chords_fts(chords_fts, rowid, name, shape) VALUES ('delete', old.id, old.name, old.shape);
+END;
+CREATE TRIGGER IF NOT EXISTS chords_au AFTER UPDATE ON chords BEGIN
+    INSERT INTO chords_fts(chords_fts, rowid, name, shape) VALUES ('delete', old.id, old.name, old.shape);
+    INSERT INTO chords_fts(rowid, name, shape) VALUES (new.id, new.name, new.shape);
+END;
+"""
+CHORD_UPSERT = "INSERT INTO chords(name, shape) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET shape = excluded.shape"
 
 class ChordLibrary:
-    def __init__(self, path: Path):
+    # Stored in SQLite so adding a chord is a single-row upsert rather than a full
+    # file rewrite. `chords` mirrors the table for the per-token lookups in tab generation.
+    # json_path seeds an empty library and is the default target of export_json().
+    def __init__(self, path: Path, json_path: Optional[Path] = None):
         self.path = path
+        self.json_path = json_path
         self.chords: Dict[str, str] = {}
+        self.fts = False
+        self.conn = self._connect()
         self.load()
 
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3  # deferred: only needed once the library is opened
+        conn = sqlite3.connect(str(self.path))
+        try:
+            self._init_schema(conn)
+        except sqlite3.DatabaseError:
+            conn.close()
+            # Keep the damaged file for inspection; load() then rebuilds from json_path.
+            aside = self.path.with_name(self.path.name + ".corrupt")
+            os.replace(self.path, aside)
+            for suffix in ("-journal", "-wal", "-shm"):
+                try:
+                    os.replace(f"{self.path}{suffix}", f"{aside}{suffix}")
+                except FileNotFoundError:
+                    pass
+            print(f"Warning: {self.path.name} is corrupted; moved it to {aside.name} and starting a new one.")
+            conn = sqlite3.connect(str(self.path))
+            self._init_schema(conn)
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        import sqlite3
+        conn.executescript(CHORDS_SCHEMA)
+        try:
+            conn.executescript(CHORDS_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:  # no FTS5, or SQLite too old for the trigram tokenizer
+            self.fts = False
+
     def load(self) -> None:
-        if self.path.exists():
-            try:
-                self.chords = json.loads(self.path.read_text(encoding='utf-8'))
-            except Exception:
-                print("Warning: chords.json is corrupted; starting fresh.")
-                self.chords = {}
-        else:
-            self.chords = {}
+        empty = self.conn.execute("SELECT 1 FROM chords LIMIT 1").fetchone() is None
+        if empty and self.json_path is not None and self.json_path.exists():
+            self._import_json(self.json_path)
+        # Interned keys let lookups with interned note/chord tokens match by identity.
+        self.chords = {sys.intern(n): s for n, s in self.conn.execute("SELECT name, shape FROM chords ORDER BY id")}
+
+    def _import_json(self, json_path: Path) -> None:
+        try:
+            raw = json_loads(read_bytes(json_path))
+            items = [(str(k), str(v)) for k, v in raw.items()]
+        except Exception:
+            print(f"Warning: {json_path.name} is corrupted; starting fresh.")
+            return
+        with self.conn:
+            self.conn.executemany(CHORD_UPSERT, items)
 
     def save(self) -> None:
-        self.path.write_text(json.dumps(self.chords, indent=2, ensure_ascii=False), encoding='utf-8')
+        self.conn.commit()
+
+    def export_json(self, path: Optional[Path] = None) -> None:
+        write_bytes_atomic(path or self.json_path, json_dumps(self.chords))
 
-    def add_chord(self, name: str, shape: str) -> None:
+    def add_chord(self, name: str, shape: str, save: bool = True) -> None:
         cs = ChordShape(name=name, shape=shape)
         cs.validate()
+        name = sys.intern(name)
+        self.conn.execute(CHORD_UPSERT, (name, shape))
         self.chords[name] = shape
+        if save:
+            self.save()
+
+    def bulk_add(self, items: Iterable[Tuple[str, str]]) -> None:
+        # One commit for the whole batch instead of one per chord.
+        for name, shape in items:
+            self.add_chord(name, shape, save=False)
         self.save()
 
     def list_chords(self) -> List[Tuple[str, str]]:
@@ -117,12 +286,31 @@ class ChordLibrary:
 
     def find(self, query: str) -> List[Tuple[str, str]]:
         q = query.lower()
-        return [(n,s) for n,s in self.chords.items() if q in n.lower() or q in s.lower()]
+        if not q:
+            return list(self.chords.items())
+        if not self.fts or len(q) < 3:
+            # The trigram index needs three characters; SQLite LIKE would only fold ASCII case.
+            return [(n, s) for n, s in self.chords.items() if q in n.lower() or q in s.lower()]
+        rows = self.conn.execute(
+            "SELECT c.name, c.shape FROM chords_fts JOIN chords c ON c.id = chords_fts.rowid"
+            " WHERE chords_fts MATCH ? ORDER BY c.id",
+            ('"' + q.replace('"', '""') + '"',),
+        )
+        return [(n, s) for n, s in rows]
 
 # =============== ABC Parsing (headers & body) ===============
 
 HEADER_FIELD_RE = re.compile(r"^(X|T|S|Q|L|M|K):")
-ABC_TOKEN_RE = re.compile(r"\^|_|=|[A-Ga-g]|[,']|\d+|\|+|\s+|\(|\)|:")
+# No capturing groups and nothing that matches whitespace: findall() returns the
+# token strings directly and simply skips everything else.
+ABC_TOKEN_RE = re.compile(r"\|+|[\^_=]|[A-Ga-g]|[,']|\d+|[():]")
+NOTE_START_CHARS = frozenset("^_=ABCDEFGabcdefg")  # tokens that open a melody note
+OCTAVE_MOD_CHARS = frozenset(",'")
+# Parsed scores keyed by a 64-bit content digest, so re-parsing identical text
+# (e.g. the same file via another path, or a re-import) costs one hash.
+PARSE_CACHE_MAX = 32
+PARSE_CACHE: "OrderedDict[Tuple[bytes, Optional[str]], AbcScore]" = OrderedDict()
+PARSE_LOCK = threading.Lock()  # parse() runs on import workers and the watcher thread too
 
 @dataclass
 class AbcScore:
@@ -171,113 +359,216 @@ class AbcParser:
 
     @staticmethod
     def parse(text: str, title_hint: Optional[str]=None) -> AbcScore:
+        import hashlib  # deferred: only needed once a score is parsed
+        # Cached scores are shared; callers only read them.
+        key = (hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), title_hint)
+        with PARSE_LOCK:
+            score = PARSE_CACHE.get(key)
+            if score is not None:
+                PARSE_CACHE.move_to_end(key)
+                return score
+        score = AbcParser._parse(text, title_hint)  # outside the lock so workers parse in parallel
+        with PARSE_LOCK:
+            PARSE_CACHE[key] = score
+            while len(PARSE_CACHE) > PARSE_CACHE_MAX:
+                PARSE_CACHE.popitem(last=False)
+        return score
+
+    @staticmethod
+    def _parse(text: str, title_hint: Optional[str]) -> AbcScore:
         header, body_lines = AbcParser.split_header_body(text)
         title = AbcParser.extract_title(header, title_hint or "Untitled")
         key = AbcParser.extract_key(header)
         body = "\n".join(body_lines)
-        raw_tokens = [t for t in ABC_TOKEN_RE.findall(body) if not t.isspace()]
         tokens: List[str] = []
-        for t in raw_tokens:
-            if t.startswith('|'):
-                if not tokens or tokens[-1] != '|':
-                    tokens.append('|')
-                continue
-            tokens.append(t)
+        for is_bar, run in groupby(ABC_TOKEN_RE.findall(body), key=lambda t: t[0] == '|'):
+            if is_bar:
+                tokens.append('|')  # one bar for any run, including bars split by whitespace
+            else:
+                # Tunes use a few dozen distinct tokens; interning shares them across the list.
+                tokens.extend(map(sys.intern, run))
         return AbcScore(title=title, key=key, tokens=tokens)
 
 # =============== Songs ===============
 
+SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._\- ]+")
+
+# Parsed files keyed by path and validated against (mtime_ns, size), so
+# repeated workflow steps on an unchanged song skip the read and parse.
+FILE_CACHE_MAX = 64
+SCORE_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], AbcScore]]" = OrderedDict()
+MAPPING_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, str]]]" = OrderedDict()
+FILE_CACHE_LOCK = threading.Lock()  # import workers and the watcher thread use these too
+
+def file_stamp(path: StrPath) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def cache_get(cache: OrderedDict, path: StrPath, stamp: Tuple[int, int]):
+    with FILE_CACHE_LOCK:
+        hit = cache.get(str(path))
+        if hit is None or hit[0] != stamp:
+            return None
+        cache.move_to_end(str(path))
+        return hit[1]
+
+def cache_put(cache: OrderedDict, path: StrPath, stamp: Tuple[int, int], value) -> None:
+    with FILE_CACHE_LOCK:
+        cache[str(path)] = (stamp, value)
+        cache.move_to_end(str(path))
+        while len(cache) > FILE_CACHE_MAX:
+            cache.popitem(last=False)
+
+def cache_drop(cache: OrderedDict, path: StrPath) -> None:
+    with FILE_CACHE_LOCK:
+        cache.pop(str(path), None)
+
 @dataclass
 class Song:
     name: str
     path: Path
-    abc_path: Path
-    mapping_path: Path
-    tab_path: Path
-    melody_tab_path: Path
+    # File paths are pre-joined strings: they are only ever opened or stat'ed.
+    abc_path: str
+    mapping_path: str
+    tab_path: str
+    melody_tab_path: str
 
     @staticmethod
     def from_name(name: str) -> 'Song':
-        safe = re.sub(r"[^A-Za-z0-9._\- ]+", "_", name).strip() or "Untitled"
+        safe = SAFE_NAME_RE.sub("_", name).strip() or "Untitled"
         sp = SONGS_DIR / safe
         return Song(
             name=safe,
             path=sp,
-            abc_path=sp / "abc.txt",
-            mapping_path=sp / "mapping.json",
-            tab_path=sp / "tab.txt",
-            melody_tab_path=sp / "melody_tab.txt",
+            abc_path=os.path.join(sp, "abc.txt"),
+            mapping_path=os.path.join(sp, "mapping.json"),
+            tab_path=os.path.join(sp, "tab.txt"),
+            melody_tab_path=os.path.join(sp, "melody_tab.txt"),
         )
 
     def ensure_dirs(self):
         self.path.mkdir(parents=True, exist_ok=True)
 
+    def load_score(self) -> AbcScore:
+        stamp = file_stamp(self.abc_path)
+        if stamp is None:
+            return AbcParser.parse('', title_hint=self.name)
+        score = cache_get(SCORE_CACHE, self.abc_path, stamp)
+        if score is None:
+            with open(self.abc_path, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read()
+            score = AbcParser.parse(text, title_hint=self.name)
+            cache_put(SCORE_CACHE, self.abc_path, stamp, score)
+        return score
+
     def load_mapping(self) -> Dict[str, str]:
-        if self.mapping_path.exists():
+        stamp = file_stamp(self.mapping_path)
+        if stamp is not None:
+            mapping = cache_get(MAPPING_CACHE, self.mapping_path, stamp)
+            if mapping is not None:
+                return dict(mapping)  # callers mutate the mapping they get back
             try:
-                return json.loads(self.mapping_path.read_text(encoding='utf-8'))
+                raw = json_loads(read_bytes(self.mapping_path))
+                mapping = {}
+                skipped: List[str] = []
+                for k, v in raw.items():
+                    if isinstance(v, str):  # sys.intern() only takes str; JSON keys always are
+                        mapping[sys.intern(k)] = sys.intern(v)
+                    else:
+                        skipped.append(k)
+                if skipped:
+                    print(f"Warning: mapping.json has non-text chords for {', '.join(skipped)}; ignoring them.")
+                cache_put(MAPPING_CACHE, self.mapping_path, stamp, mapping)
+                return dict(mapping)
             except Exception:
                 print("Warning: mapping.json corrupted; starting empty.")
         return {}
 
     def save_mapping(self, mapping: Dict[str, str]):
-        self.mapping_path.write_text(json.dumps(mapping, indent=2, ensure_ascii=False), encoding='utf-8')
+        write_bytes_atomic(self.mapping_path, json_dumps(mapping, indent=False))
+        # mtime granularity can hide a same-size rewrite, so drop the entry outright.
+        cache_drop(MAPPING_CACHE, self.mapping_path)
 
 # =============== Tab Generation (Chord blocks) ===============
 
 STRING_ORDER = ["E", "A", "D", "G", "B", "e"]
 
-def split_shape_6(shape: str) -> List[str]:
-    groups = ChordShape._split_shape(shape)
+def split_shape_6(shape: str) -> Tuple[str, ...]:
+    groups = split_shape_cached(shape)
     if len(groups) != 6:
         raise ValueError("Chord shape must have 6 entries.")
     return groups
 
+@lru_cache(maxsize=256)
+def render_chord_block(name: str, shape: str) -> str:
+    groups = split_shape_6(shape)
+    e_to_E = list(reversed(groups))
+    lines = [f"{s}|- {fret}" for s, fret in zip(["e","B","G","D","A","E"], e_to_E)]
+    title = f"[{name}]"
+    return title + "\n" + "\n".join(lines)
+
 class TabGenerator:
     @staticmethod
     def chord_block(name: str, shape: str) -> str:
-        groups = split_shape_6(shape)
-        e_to_E = list(reversed(groups))
-        lines = [f"{s}|- {fret}" for s, fret in zip(["e","B","G","D","A","E"], e_to_E)]
-        title = f"[{name}]"
-        return title + "\n" + "\n".join(lines)
+        return render_chord_block(name, shape)
 
     @staticmethod
     def generate_tab(tokens: List[str], mapping: Dict[str, str], lib: ChordLibrary) -> str:
-        out_lines: List[str] = []
+        return "\n".join(TabGenerator.iter_tab_lines(tokens, mapping, lib))
+
+    @staticmethod
+    def generate_tab_to(tokens: List[str], mapping: Dict[str, str], lib: ChordLibrary, out_path: StrPath) -> None:
+        write_lines(out_path, TabGenerator.iter_tab_lines(tokens, mapping, lib))
+
+    @staticmethod
+    def iter_tab_lines(tokens: List[str], mapping: Dict[str, str], lib: ChordLibrary) -> Iterator[str]:
         segment: List[str] = []
+        # Segment entries per distinct note+duration token; notes repeat far more
+        # often than they vary, so mapping/library lookups happen once per token kind.
+        resolved: Dict[str, Tuple[str, ...]] = {}
+        blocks: Dict[str, str] = {}  # chord name -> rendered block, for this song
+        n = len(tokens)
         i = 0
-        while i < len(tokens):
+        while i < n:
             t = tokens[i]
             if t == '|':
                 if segment:
-                    out_lines.append(" | ".join(segment))
-                    out_lines.append("-")
+                    yield " | ".join(segment)
+                    yield "-"
                     segment = []
                 else:
-                    out_lines.append("|")
+                    yield "|"
                 i += 1
                 continue
             # Build note token with following digits for duration
             note_token = t
             j = i + 1
-            while j < len(tokens) and re.fullmatch(r"\d+", tokens[j]):
+            while j < n and tokens[j].isdigit():
                 note_token += tokens[j]
                 j += 1
-            chord_name = mapping.get(note_token)
-            if not chord_name:
-                segment.append(f"{note_token} → [unmapped]")
-            else:
-                shape = lib.chords.get(chord_name)
-                if not shape:
-                    segment.append(f"{note_token} → {chord_name} [missing in lib]")
-                else:
-                    segment.append(f"{note_token} → {chord_name}")
-                    segment.append(TabGenerator.chord_block(chord_name, shape))
+            entries = resolved.get(note_token)
+            if entries is None:
+                entries = resolved[note_token] = TabGenerator._resolve(note_token, mapping, lib, blocks)
+            segment.extend(entries)
             i = j
         if segment:
-            out_lines.append(" | ".join(segment))
-        return "\n".join(out_lines)
+            yield " | ".join(segment)
+
+    @staticmethod
+    def _resolve(note_token: str, mapping: Dict[str, str], lib: ChordLibrary, blocks: Dict[str, str]) -> Tuple[str, ...]:
+        chord_name = mapping.get(sys.intern(note_token))
+        if not chord_name:
+            return (f"{note_token} → [unmapped]",)
+        shape = lib.chords.get(chord_name)
+        if not shape:
+            return (f"{note_token} → {chord_name} [missing in lib]",)
+        rendered = blocks.get(chord_name)
+        if rendered is None:
+            rendered = blocks[chord_name] = TabGenerator.chord_block(chord_name, shape)
+        return (f"{note_token} → {chord_name}", rendered)
 
 # =============== Melody Tab (single‑note) ===============
 
@@ -290,22 +581,37 @@ OPEN_STRING_MIDI = {
     'e': 64,  # E4
 }
 STRINGS_HIGH_TO_LOW = ['e','B','G','D','A','E']
+STRING_TABLE = tuple((i, s, OPEN_STRING_MIDI[s]) for i, s in enumerate(STRINGS_HIGH_TO_LOW))
 
 ABC_BASE_MIDI = {
     'C': 60, 'D': 62, 'E': 64, 'F': 65, 'G': 67, 'A': 69, 'B': 71,
     'c': 72, 'd': 74, 'e': 76, 'f': 77, 'g': 79, 'a': 81, 'b': 83,
 }
 ACCIDENTAL_OFFSET = {'^': 1, '_': -1, '=': 0}
+ABC_NOTE_PARTS_RE = re.compile(r"(?P<acc>\^|_|=)?(?P<note>[A-Ga-g])(?P<oct>[',]*)")
 
-@dataclass
-class FretPos:
+class FretPos(NamedTuple):
     string: str
     fret: int
 
+# Both lookups are pure functions over a tiny alphabet, so results are kept for
+# the life of the process.
+MIDI_CACHE: Dict[str, Optional[int]] = {}
+FRET_CACHE: Dict[int, Optional[int]] = {}
+
 class MelodyTabber:
     @staticmethod
     def abc_note_to_midi(token: str) -> Optional[int]:
-        m = re.match(r"(?P<acc>\^|_|=)?(?P<note>[A-Ga-g])(?P<oct>[',]*)", token)
+        v = MIDI_CACHE.get(token)
+        if v is not None or token in MIDI_CACHE:
+            return v
+        v = MelodyTabber._compute_midi(token)
+        MIDI_CACHE[token] = v
+        return v
+
+    @staticmethod
+    def _compute_midi(token: str) -> Optional[int]:
+        m = ABC_NOTE_PARTS_RE.match(token)
         if not m:
             return None
         acc = m.group('acc') or ''
@@ -324,14 +630,28 @@ class MelodyTabber:
 
     @staticmethod
     def choose_fret(midi: int) -> Optional[FretPos]:
-        best: Optional[FretPos] = None
-        for s in STRINGS_HIGH_TO_LOW:
-            open_m = OPEN_STRING_MIDI[s]
-            fret = midi - open_m
-            if 0 <= fret <= 24:
-                if best is None or fret < best.fret or (fret == best.fret and STRINGS_HIGH_TO_LOW.index(s) < STRINGS_HIGH_TO_LOW.index(best.string)):
-                    best = FretPos(string=s, fret=fret)
-        return best
+        v = MelodyTabber._choose_fret_packed(midi)
+        if v is None:
+            return None
+        return FretPos(string=STRINGS_HIGH_TO_LOW[v >> 8], fret=v & 0xFF)
+
+    # Packed form (string_rank << 8) | fret, used by the render loop to skip FretPos allocation.
+    @staticmethod
+    def _choose_fret_packed(midi: int) -> Optional[int]:
+        v = FRET_CACHE.get(midi)
+        if v is not None or midi in FRET_CACHE:
+            return v
+        # Open strings descend in pitch, so the first one at or below the note gives
+        # the lowest fret (and the highest string on ties); lower strings only add frets.
+        v = None
+        for rank, _, open_m in STRING_TABLE:
+            if open_m <= midi:
+                fret = midi - open_m
+                if fret <= 24:
+                    v = (rank << 8) | fret
+                break
+        FRET_CACHE[midi] = v
+        return v
 
     @staticmethod
     def tokens_to_notes(tokens: List[str]) -> List[str]:
@@ -343,15 +663,15 @@ class MelodyTabber:
                 out.append('|')
                 i += 1
                 continue
-            if re.fullmatch(r"\^|_|=|[A-Ga-g]", t):
+            if t in NOTE_START_CHARS:
                 tok = t
                 j = i + 1
-                while j < len(tokens) and re.fullmatch(r"[,']", tokens[j]):
+                while j < len(tokens) and tokens[j] in OCTAVE_MOD_CHARS:
                     tok += tokens[j]
                     j += 1
-                out.append(tok)
+                out.append(sys.intern(tok))
                 i = j
-                while i < len(tokens) and re.fullmatch(r"\d+", tokens[i]):
+                while i < len(tokens) and tokens[i].isdigit():
                     i += 1
             else:
                 i += 1
@@ -371,26 +691,33 @@ class MelodyTabber:
 
     @staticmethod
     def render_3bars_per_line(bars: List[List[str]]) -> str:
-        lines: List[str] = []
+        return "\n".join(MelodyTabber.iter_3bars_lines(bars))
+
+    @staticmethod
+    def iter_3bars_lines(bars: List[List[str]]) -> Iterator[str]:
+        # Bind hot lookups to locals once; the loop runs per note.
+        to_midi = MelodyTabber.abc_note_to_midi
+        choose = MelodyTabber._choose_fret_packed
+        strings = STRINGS_HIGH_TO_LOW
         for i in range(0, len(bars), 3):
+            if i:
+                yield ""
             chunk = bars[i:i+3]
-            string_lines = {s: [] for s in STRINGS_HIGH_TO_LOW}
+            rows: List[List[str]] = [[] for _ in strings]
             for bar in chunk:
                 for note in bar:
-                    midi = MelodyTabber.abc_note_to_midi(note)
-                    pos = MelodyTabber.choose_fret(midi) if midi is not None else None
-                    for s in STRINGS_HIGH_TO_LOW:
-                        if pos and s == pos.string:
-                            string_lines[s].append(str(pos.fret))
-                        else:
-                            string_lines[s].append('-')
-                for s in STRINGS_HIGH_TO_LOW:
-                    string_lines[s].append('|')
-            for s in STRINGS_HIGH_TO_LOW:
-                row = f"{s}| " + ' '.join(string_lines[s]).rstrip('|').rstrip()
-                lines.append(row)
-            lines.append("")
-        return "\n".join(lines).rstrip()
+                    midi = to_midi(note)
+                    pos = choose(midi) if midi is not None else None
+                    for row in rows:
+                        row.append('-')
+                    if pos is not None:
+                        rows[pos >> 8][-1] = str(pos & 0xFF)
+                for row in rows:
+                    row.append('|')
+            rendered = [f"{s}| " + ' '.join(row).rstrip('|').rstrip() for s, row in zip(strings, rows)]
+            if i + 3 >= len(bars):
+                rendered[-1] = rendered[-1].rstrip()  # the tab never ends in whitespace
+            yield from rendered
 
     @staticmethod
     def generate_melody_tab(score: AbcScore) -> str:
@@ -398,28 +725,222 @@ class MelodyTabber:
         bars = MelodyTabber.build_bar_blocks(note_tokens)
         return MelodyTabber.render_3bars_per_line(bars)
 
+    @staticmethod
+    def generate_melody_tab_to(score: AbcScore, out_path: StrPath) -> None:
+        note_tokens = MelodyTabber.tokens_to_notes(score.tokens)
+        bars = MelodyTabber.build_bar_blocks(note_tokens)
+        write_lines(out_path, MelodyTabber.iter_3bars_lines(bars))
+
 # =============== Import ABC from inbox ===============
 
+# Serializes menu-driven and background imports so an inbox file is handled once.
+IMPORT_LOCK = threading.Lock()
+
 class Importer:
     @staticmethod
-    def import_new_abc() -> List[Song]:
-        imported: List[Song] = []
-        for p in sorted(INBOX_DIR.glob("*.txt")):
+    def import_new_abc(report_empty: bool = True) -> List[Song]:
+        with IMPORT_LOCK:
+            with os.scandir(INBOX_DIR) as it:
+                paths = sorted(Path(e.path) for e in it if e.name.endswith(".txt") and e.is_file())
+            if not paths:
+                if report_empty:
+                    print("No new ABC files found in abc_inbox/ (expect .txt).")
+                return []
+            imported, failed = Importer.import_paths(paths)
+        for p, song in imported:
+            print(f"Imported '{song.name}' from {p.name}")
+        for p, e in failed:
+            print(f"Error importing {p.name}: {e}")
+        return [song for _, song in imported]
+
+    # Callers hold IMPORT_LOCK.
+    @staticmethod
+    def import_paths(paths: List[Path]) -> Tuple[List[Tuple[Path, Song]], List[Tuple[Path, Exception]]]:
+        # Returns (imported, failed) in inbox order; one bad file never holds back the rest.
+        from concurrent.futures import ThreadPoolExecutor  # deferred: only needed when importing
+        PROCESSED_DIR.mkdir(exist_ok=True)
+        # Files are independent and the work is mostly file I/O, which releases the GIL.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+            results = list(ex.map(Importer._read_one, paths))
+            failed = [(p, r) for p, r in zip(paths, results) if isinstance(r, Exception)]
+            groups: Dict[str, List[Tuple[Path, Song]]] = {}
+            for p, r in zip(paths, results):
+                if not isinstance(r, Exception):
+                    groups.setdefault(r.name, []).append((p, r))
+            same_dev = os.stat(INBOX_DIR).st_dev == os.stat(SONGS_DIR).st_dev == os.stat(PROCESSED_DIR).st_dev
+            for errors in ex.map(lambda items: Importer._store_group(items, same_dev), groups.values()):
+                failed.extend(errors)
+        errors = dict(failed)
+        imported = [(p, r) for p, r in zip(paths, results) if p not in errors]
+        return imported, [(p, errors[p]) for p in paths if p in errors]
+
+    @staticmethod
+    def _read_one(p: Path) -> Union[Song, Exception]:
+        try:
             text = p.read_text(encoding='utf-8', errors='ignore')
             score = AbcParser.parse(text, title_hint=p.stem)
-            song = Song.from_name(score.title)
-            song.ensure_dirs()
-            song.abc_path.write_text(text, encoding='utf-8')
-            if not song.mapping_path.exists():
-                song.save_mapping({})
-            PROCESSED_DIR.mkdir(exist_ok=True)
-            dest = PROCESSED_DIR / p.name
-            shutil.move(str(p), str(dest))
-            imported.append(song)
-            print(f"Imported '{song.name}' from {dest.name}")
-        if not imported:
-            print("No new ABC files found in abc_inbox/ (expect .txt).")
-        return imported
+            return Song.from_name(score.title)
+        except Exception as e:  # returned, not raised, so ex.map keeps the other files
+            return e
+
+    @staticmethod
+    def _store_group(items: List[Tuple[Path, Song]], same_dev: bool) -> List[Tuple[Path, Exception]]:
+        # Inbox files resolving to the same song stay in one worker, in inbox order,
+        # so the last one wins exactly as in a sequential import.
+        errors: List[Tuple[Path, Exception]] = []
+        for p, song in items:
+            try:
+                song.ensure_dirs()
+                if not (same_dev and Importer._link_and_archive(p, song)):
+                    import shutil  # deferred: only needed on the copy fallback
+                    # Copy the original bytes instead of re-encoding the decoded text.
+                    shutil.copyfile(p, song.abc_path)
+                    shutil.move(str(p), str(PROCESSED_DIR / p.name))
+                if not os.path.exists(song.mapping_path):
+                    song.save_mapping({})
+            except Exception as e:
+                errors.append((p, e))
+        return errors
+
+    @staticmethod
+    def _link_and_archive(p: Path, song: Song) -> bool:
+        # Same filesystem: hard-link the inbox file as abc.txt and rename it into
+        # abc_processed/, so no bytes are copied. False means fall back to copying.
+        tmp = song.abc_path + '.tmp'
+        try:
+            os.unlink(tmp)  # left behind by an interrupted import; os.link won't overwrite it
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(p, tmp)
+        except OSError:  # e.g. no hard-link support on this filesystem
+            return False
+        os.replace(tmp, song.abc_path)
+        os.replace(p, PROCESSED_DIR / p.name)
+        return True
+
+# =============== Inbox Watcher (optional) ===============
+
+class InboxHandler:
+    # Duck-types watchdog's FileSystemEventHandler (observers only call dispatch()),
+    # so watchdog itself is imported only when the watcher starts.
+    def __init__(self, watcher: 'InboxWatcher'):
+        self.watcher = watcher
+
+    def dispatch(self, event) -> None:
+        if event.is_directory:
+            return
+        if event.event_type == 'moved':  # editors often write a temp file and rename it into place
+            self._touch(event.dest_path)
+        elif event.event_type in ('created', 'modified', 'closed'):  # modified: still being written
+            self._touch(event.src_path)
+
+    def _touch(self, path) -> None:
+        p = Path(os.fsdecode(path))
+        if p.suffix == ".txt" and p.parent == INBOX_DIR:
+            self.watcher.seen[p] = (time.monotonic(), file_stamp(p))
+            self.watcher.pending.put(p)
+
+class InboxWatcher:
+    SETTLE_SECONDS = 0.5  # quiet time a file needs (no events, no size/mtime change) before import
+
+    def __init__(self):
+        import queue  # deferred with watchdog: only the watcher uses it
+        self.pending: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self.notices: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        # path -> (time of its latest event, its (mtime_ns, size) then); written by the observer thread
+        self.seen: Dict[Path, Tuple[float, Optional[Tuple[int, int]]]] = {}
+        self.hurry = threading.Event()  # set while flushing or stopping: skip the settle wait
+        self.observer = None
+        self.thread = threading.Thread(target=self._consume, daemon=True)
+
+    @staticmethod
+    def start() -> Optional['InboxWatcher']:
+        try:  # optional: background import of files dropped into abc_inbox/
+            from watchdog.observers import Observer
+            from watchdog.observers.polling import PollingObserver
+        except ImportError:
+            return None
+        w = InboxWatcher()
+        handler = InboxHandler(w)
+        try:
+            observer = Observer()
+            observer.schedule(handler, str(INBOX_DIR), recursive=False)
+            observer.start()
+        except OSError:  # e.g. inotify watch limit reached, or a mount without native events
+            observer = PollingObserver(timeout=30)
+            observer.schedule(handler, str(INBOX_DIR), recursive=False)
+            observer.start()
+        w.observer = observer
+        w.thread.start()
+        return w
+
+    def _consume(self) -> None:
+        while True:
+            batch = [self.pending.get()]
+            while not self.pending.empty():  # this thread is the only consumer
+                batch.append(self.pending.get())
+            try:
+                paths = list(dict.fromkeys(p for p in batch if p is not None))
+                if paths:
+                    self._settle(paths)
+                    self._import(paths)
+                    for p in paths:
+                        self.seen.pop(p, None)
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+            if None in batch:
+                return
+
+    def _settle(self, paths: List[Path]) -> None:
+        # Waits until every file has gone SETTLE_SECONDS without an event or a change in
+        # mtime/size; the stat catches writers whose events never reach us (e.g. network shares).
+        while not self.hurry.is_set():
+            now = time.monotonic()
+            deadline = now
+            for p in paths:
+                last, stamp = self.seen.get(p, (now, None))
+                current = file_stamp(p)
+                if current != stamp:
+                    self.seen[p] = (now, current)
+                    last = now
+                deadline = max(deadline, last + self.SETTLE_SECONDS)
+            if deadline <= now:
+                return
+            self.hurry.wait(deadline - now)
+
+    def _import(self, paths: List[Path]) -> None:
+        with IMPORT_LOCK:
+            paths = [p for p in paths if p.is_file()]  # a menu import may have taken some
+            if not paths:
+                return
+            imported, failed = Importer.import_paths(paths)
+        for p, song in imported:
+            self.notices.put(f"Imported '{song.name}' from {p.name}")
+        for p, e in failed:
+            self.notices.put(f"Error importing {p.name}: {e}")
+
+    def flush(self) -> None:
+        # Imports everything queued so far without waiting out the settle time.
+        self.hurry.set()
+        try:
+            self.pending.join()
+        finally:
+            self.hurry.clear()
+
+    def take_notices(self) -> List[str]:
+        out: List[str] = []
+        while not self.notices.empty():  # only the main thread takes notices
+            out.append(self.notices.get())
+        return out
+
+    def stop(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+        self.hurry.set()
+        self.pending.put(None)
+        self.thread.join()
 
 # =============== Interaction Helpers ===============
 
@@ -443,34 +964,57 @@ def choose_from_list(title: str, items: List[str]) -> Optional[str]:
 
 # =============== Workflows ===============
 
+SONG_MENU = "\n".join([
+    "  1) View mapping summary",
+    "  2) Map notes → chords (add/search, with back)",
+    "  3) Generate chord-block tab → tab.txt",
+    "  4) Generate MELODY tab (3 bars/line) → melody_tab.txt",
+    "  5) Edit ABC title or rename song folder",
+    "  0) Back",
+])
+
 def workflow_add_chords(lib: ChordLibrary):
     print("\nAdd chords to global library. Enter blank name to stop. (0 to back)")
-    while True:
-        name = input("Chord name (e.g., E, Am, Gadd9) [0=back]: ").strip()
-        if name == '0' or not name:
-            break
-        shape = input_nonempty("Shape E A D G B e (digits/x). Examples: 022100, x02210, 3 2 0 0 0 3 [0=back]: ")
-        if shape is None:
-            break
-        try:
-            lib.add_chord(name, shape)
-            print(f"Added {name} → {lib.chords[name]}")
-        except Exception as e:
-            print(f"Error: {e}")
+    pending: List[Tuple[str, str]] = []
+    try:
+        while True:
+            name = input("Chord name (e.g., E, Am, Gadd9) [0=back]: ").strip()
+            if name == '0' or not name:
+                break
+            shape = input_nonempty("Shape E A D G B e (digits/x). Examples: 022100, x02210, 3 2 0 0 0 3 [0=back]: ")
+            if shape is None:
+                break
+            try:
+                ChordShape(name=name, shape=shape).validate()
+                pending.append((name, shape))
+                print(f"Added {name} → {shape}")
+            except Exception as e:
+                print(f"Error: {e}")
+    finally:
+        if pending:
+            lib.bulk_add(pending)
 
 
-def workflow_import_abc():
+def workflow_import_abc(watcher: Optional[InboxWatcher] = None):
     print("\nImporting new ABC files from abc_inbox/ ...")
-    Importer.import_new_abc()
+    notices: List[str] = []
+    if watcher:
+        watcher.flush()
+        notices = watcher.take_notices()
+        for msg in notices:
+            print(msg)
+    Importer.import_new_abc(report_empty=not notices)
 
 
 def list_songs() -> List[Song]:
     songs: List[Song] = []
-    for d in sorted(SONGS_DIR.iterdir()):
-        if d.is_dir():
-            s = Song.from_name(d.name)
-            if s.abc_path.exists():
-                songs.append(s)
+    # scandir entries carry their type from the directory read, so is_dir() rarely needs a stat.
+    with os.scandir(SONGS_DIR) as it:
+        names = sorted(e.name for e in it if e.is_dir())
+    for name in names:
+        s = Song.from_name(name)
+        if os.path.exists(s.abc_path):
+            songs.append(s)
     return songs
 
 
@@ -499,21 +1043,16 @@ def workflow_work_on_song(lib: ChordLibrary):
     if not chosen:
         return
     song = Song.from_name(chosen)
-    abc_full = song.abc_path.read_text(encoding='utf-8') if song.abc_path.exists() else ''
-    score = AbcParser.parse(abc_full, title_hint=song.name)
+    score = song.load_score()
     mapping = song.load_mapping()
+    # Tokens never change while the song is open (rename only moves files), so dedupe once.
+    unique_notes = sorted({t for t in MelodyTabber.tokens_to_notes(score.tokens) if t != '|'})
 
     while True:
-        print(f"\nWorking on: {song.name}")
-        print("  1) View mapping summary")
-        print("  2) Map notes → chords (add/search, with back)")
-        print("  3) Generate chord-block tab → tab.txt")
-        print("  4) Generate MELODY tab (3 bars/line) → melody_tab.txt")
-        print("  5) Edit ABC title or rename song folder")
-        print("  0) Back")
+        print(f"\nWorking on: {song.name}\n{SONG_MENU}")
         choice = input("Choose: ").strip()
         if choice == '1':
-            used = sorted({t for t in MelodyTabber.tokens_to_notes(score.tokens) if t != '|'})
+            used = unique_notes
             print("Notes in score:", ", ".join(used) if used else "(none)")
             print("Mapped:")
             for n, c in sorted(mapping.items()):
@@ -521,7 +1060,7 @@ def workflow_work_on_song(lib: ChordLibrary):
             missing = [n for n in used if n not in mapping]
             print(f"Missing ({len(missing)}):", ", ".join(missing))
         elif choice == '2':
-            notes = sorted({t for t in MelodyTabber.tokens_to_notes(score.tokens) if t != '|'}, key=lambda x: x)
+            notes = unique_notes
             if not notes:
                 print("No note tokens found in ABC body.")
                 continue
@@ -568,12 +1107,10 @@ def workflow_work_on_song(lib: ChordLibrary):
             song.save_mapping(mapping)
             print("Saved mapping.")
         elif choice == '3':
-            tab = TabGenerator.generate_tab(score.tokens, mapping, lib)
-            song.tab_path.write_text(tab, encoding='utf-8')
+            TabGenerator.generate_tab_to(score.tokens, mapping, lib, song.tab_path)
             print(f"Tab written to {song.tab_path}")
         elif choice == '4':
-            melody = MelodyTabber.generate_melody_tab(score)
-            song.melody_tab_path.write_text(melody, encoding='utf-8')
+            MelodyTabber.generate_melody_tab_to(score, song.melody_tab_path)
             print(f"Melody tab written to {song.melody_tab_path}")
         elif choice == '5':
             newname = input_nonempty("New song name [0=back]: ")
@@ -583,19 +1120,24 @@ def workflow_work_on_song(lib: ChordLibrary):
             if new_song.path.exists():
                 print("A song with that name already exists.")
             else:
-                new_song.ensure_dirs()
-                for src, dest in [
-                    (song.abc_path, new_song.abc_path),
-                    (song.mapping_path, new_song.mapping_path),
-                    (song.tab_path, new_song.tab_path),
-                    (song.melody_tab_path, new_song.melody_tab_path),
-                ]:
-                    if src.exists():
-                        dest.write_text(src.read_text(encoding='utf-8'), encoding='utf-8')
                 try:
-                    shutil.rmtree(song.path)
-                except Exception:
-                    pass
+                    # Same filesystem: one rename moves every song file at once.
+                    os.rename(song.path, new_song.path)
+                except OSError:
+                    import shutil  # deferred: only needed on the copy fallback
+                    new_song.ensure_dirs()
+                    for src, dest in [
+                        (song.abc_path, new_song.abc_path),
+                        (song.mapping_path, new_song.mapping_path),
+                        (song.tab_path, new_song.tab_path),
+                        (song.melody_tab_path, new_song.melody_tab_path),
+                    ]:
+                        if os.path.exists(src):
+                            shutil.copyfile(src, dest)
+                    try:
+                        shutil.rmtree(song.path)
+                    except Exception:
+                        pass
                 song = new_song
                 print(f"Renamed to {song.name}")
         elif choice == '0':
@@ -613,30 +1155,49 @@ def workflow_rebuild_tab(lib: ChordLibrary):
     if not chosen:
         return
     song = Song.from_name(chosen)
-    abc_full = song.abc_path.read_text(encoding='utf-8')
-    score = AbcParser.parse(abc_full, title_hint=song.name)
+    score = song.load_score()
     mapping = song.load_mapping()
-    tab = TabGenerator.generate_tab(score.tokens, mapping, lib)
-    song.tab_path.write_text(tab, encoding='utf-8')
+    TabGenerator.generate_tab_to(score.tokens, mapping, lib, song.tab_path)
     print(f"Rebuilt: {song.tab_path}")
 
+def workflow_export_chords(lib: ChordLibrary):
+    dest = input("Export to [blank=data/chords.json, 0=back]: ").strip()
+    if dest == '0':
+        return
+    target = Path(dest).expanduser() if dest else CHORDS_JSON
+    try:
+        lib.export_json(target)
+    except OSError as e:
+        print(f"Export failed: {e}")
+        return
+    print(f"Exported {len(lib.chords)} chords to {target}")
+
 # =============== Main Menu ===============
 
+MAIN_MENU = "\n".join([
+    "\nABC→Tab Arranger",
+    " 1) Add chords to global library",
+    " 2) Convert ABC notation for new songs (import from inbox)",
+    " 3) Work on a song",
+    " 4) List chords / songs",
+    " 5) Rebuild tab for a song",
+    " 6) Quit",
+    " 7) Export chord library to JSON",
+])
+
 def main():
-    lib = ChordLibrary(CHORDS_DB)
+    lib = ChordLibrary(CHORDS_DB, CHORDS_JSON)
+    watcher = InboxWatcher.start()
     while True:
-        print("\nABC→Tab Arranger")
-        print(" 1) Add chords to global library")
-        print(" 2) Convert ABC notation for new songs (import from inbox)")
-        print(" 3) Work on a song")
-        print(" 4) List chords / songs")
-        print(" 5) Rebuild tab for a song")
-        print(" 6) Quit")
+        if watcher:
+            for msg in watcher.take_notices():
+                print(msg)
+        print(MAIN_MENU)
         choice = input("Choose: ").strip()
         if choice == '1':
             workflow_add_chords(lib)
         elif choice == '2':
-            workflow_import_abc()
+            workflow_import_abc(watcher)
         elif choice == '3':
             workflow_work_on_song(lib)
         elif choice == '4':
@@ -649,8 +1210,12 @@ def main():
         elif choice == '5':
             workflow_rebuild_tab(lib)
         elif choice == '6':
+            if watcher:
+                watcher.stop()
             print("Bye.")
             break
+        elif choice == '7':
+            workflow_export_chords(lib)
         else:
             print("Unknown choice.")
 